@@ -0,0 +1,47 @@
+"""add search_vector to assets
+
+Revision ID: b7d41c2a9f03
+Revises: ca36a5f9e76c
+Create Date: 2026-08-27 10:12:41.508214
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d41c2a9f03"
+down_revision: Union[str, Sequence[str], None] = "ca36a5f9e76c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated tsvector over name + description so search hits a GIN
+    # index instead of a dual-ILIKE sequential scan.
+    op.execute(
+        """
+        ALTER TABLE assets ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector(
+                'english',
+                coalesce(name, '') || ' ' || coalesce(description, '')
+            )
+        ) STORED
+        """
+    )
+    op.create_index(
+        "ix_assets_search_vector",
+        "assets",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_assets_search_vector", table_name="assets")
+    op.drop_column("assets", "search_vector")
@@ -0,0 +1,36 @@
+"""add composite list-filter index
+
+Revision ID: f2a88d410c57
+Revises: b7d41c2a9f03
+Create Date: 2026-08-27 10:31:07.892455
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a88d410c57"
+down_revision: Union[str, Sequence[str], None] = "b7d41c2a9f03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Composite index matching the common list-filter combination, with
+    # name as the trailing key so ORDER BY name comes out presorted, and
+    # id/site INCLUDEd so summary pages are index-only scans.
+    op.create_index(
+        "ix_assets_list_filter",
+        "assets",
+        ["status", "impact_level", "system_type", "device_class", "name"],
+        postgresql_include=["id", "site"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_assets_list_filter", table_name="assets")
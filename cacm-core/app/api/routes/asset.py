@@ -11,7 +11,6 @@ from app.models.asset import (
     AssetStatus,
     AssetCreate,
     AssetUpdate,
-    AssetListParams,
     AssetPublic,
     AssetSummary,
     AssetListResponse,
@@ -40,7 +39,9 @@ async def list_assets(
     site: str | None = None,
     status: AssetStatus | None = None,
     parent_bes_cyber_system_id: UUID | None = None,
-    search: str | None = Query(None, description="Search name or description"),
+    search: str | None = Query(
+        None, description="Full-text search on name and description"
+    ),
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     service: AssetService = Depends(_get_service),
@@ -50,9 +51,12 @@ async def list_assets(
 
     Supports filtering by CIP classification (impact level, system type,
     device class), site, status, and parent BES Cyber System. The `search`
-    parameter performs a case-insensitive match against name and description.
+    parameter performs full-text search against name and description: terms
+    are matched as whole (stemmed) words and all terms must appear, so
+    `relay substation` finds assets mentioning both words but a partial
+    hostname fragment like `sel-4` will not match `sel-487B`.
     """
-    params = AssetListParams(
+    assets, total = await service.list(
         impact_level=impact_level,
         system_type=system_type,
         device_class=device_class,
@@ -63,12 +67,11 @@ async def list_assets(
         offset=offset,
         limit=limit,
     )
-    assets, total = await service.list(params)
     return AssetListResponse(
-        items=[AssetSummary.model_validate(a) for a in assets],
+        items=assets,
         total=total,
-        offset=params.offset,
-        limit=params.limit,
+        offset=offset,
+        limit=limit,
     )
 
 
@@ -176,4 +179,16 @@ async def get_associated_assets(
         raise HTTPException(status_code=404, detail="Asset not found")
     except AssetValidationError as e:
         raise HTTPException(status_code=422, detail=e.message)
-    return [AssetSummary.model_validate(a) for a in assets]
+    # Rows are already typed from the ORM; skip Pydantic re-validation.
+    return [
+        AssetSummary.model_construct(
+            id=a.id,
+            name=a.name,
+            impact_level=a.impact_level,
+            system_type=a.system_type,
+            device_class=a.device_class,
+            site=a.site,
+            status=a.status,
+        )
+        for a in assets
+    ]
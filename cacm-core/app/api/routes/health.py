@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import socket
+import asyncio
 import time
 from datetime import datetime, timezone
 from enum import Enum
@@ -49,11 +49,15 @@ class HealthResponse(BaseModel):
 # Health Check Helpers
 
 
-def _probe_postgres(
+async def _probe_postgres(
     dsn: str,
     timeout: float = 2.0,
 ) -> PostgresHealth:
-    """Open a raw TCP socket to the Postgres host and measure latency."""
+    """Open a raw TCP connection to the Postgres host and measure latency.
+
+    Uses asyncio sockets so a slow or unreachable Postgres yields to the
+    event loop instead of pinning a threadpool slot for the full timeout.
+    """
     parsed = urlparse(dsn)
     host = parsed.hostname or "localhost"
     port = parsed.port or 5432
@@ -61,16 +65,19 @@ def _probe_postgres(
 
     t0 = time.perf_counter()
     try:
-        with socket.create_connection((host, port), timeout=timeout):
-            elapsed_ms = (time.perf_counter() - t0) * 1_000
-            return PostgresHealth(
-                status=ServiceStatus.UP,
-                host=host,
-                port=port,
-                database=database,
-                response_ms=round(elapsed_ms, 2),
-            )
-    except OSError as exc:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=timeout
+        )
+        elapsed_ms = (time.perf_counter() - t0) * 1_000
+        writer.close()
+        return PostgresHealth(
+            status=ServiceStatus.UP,
+            host=host,
+            port=port,
+            database=database,
+            response_ms=round(elapsed_ms, 2),
+        )
+    except (OSError, asyncio.TimeoutError) as exc:
         elapsed_ms = (time.perf_counter() - t0) * 1_000
         return PostgresHealth(
             status=ServiceStatus.DOWN,
@@ -82,6 +89,31 @@ def _probe_postgres(
         )
 
 
+# Load balancers hit these endpoints every few seconds per worker; cache
+# the probe result briefly so we don't open a TCP socket per request.
+_PROBE_TTL = 1.0
+_probe_lock = asyncio.Lock()
+_cached_probe: PostgresHealth | None = None
+_cached_at: float = 0.0
+
+
+async def _probe_postgres_cached(dsn: str) -> PostgresHealth:
+    """Return the last probe result, refreshing at most once per TTL window."""
+    global _cached_probe, _cached_at
+
+    if _cached_probe is not None and time.monotonic() - _cached_at < _PROBE_TTL:
+        return _cached_probe
+
+    # Single-flight: concurrent callers wait for one refresh rather than
+    # each opening their own socket.
+    async with _probe_lock:
+        if _cached_probe is not None and time.monotonic() - _cached_at < _PROBE_TTL:
+            return _cached_probe
+        _cached_probe = await _probe_postgres(dsn)
+        _cached_at = time.monotonic()
+        return _cached_probe
+
+
 # Routes
 
 
@@ -90,14 +122,14 @@ def _probe_postgres(
     summary="Aggregate health check",
     response_model=HealthResponse,
 )
-def health_root(response: Response) -> HealthResponse:
+async def health_root(response: Response) -> HealthResponse:
     """
     Returns the overall system health.
 
     * **200** - all dependencies healthy
     * **503** - one or more dependencies unreachable
     """
-    pg = _probe_postgres(str(settings.pg_dsn))
+    pg = await _probe_postgres_cached(str(settings.pg_dsn))
 
     all_ok = pg.status is ServiceStatus.UP
     if not all_ok:
@@ -116,14 +148,14 @@ def health_root(response: Response) -> HealthResponse:
     summary="PostgreSQL probe",
     response_model=PostgresHealth,
 )
-def health_postgres(response: Response) -> PostgresHealth:
+async def health_postgres(response: Response) -> PostgresHealth:
     """
     Dedicated Postgres connectivity probe.
 
     * **200** - reachable
     * **503** - unreachable
     """
-    pg = _probe_postgres(str(settings.pg_dsn))
+    pg = await _probe_postgres_cached(str(settings.pg_dsn))
     if pg.status is ServiceStatus.DOWN:
         response.status_code = 503
     return pg
@@ -0,0 +1,119 @@
+"""
+Result models for SNMP polls.
+
+Plain dataclasses rather than Pydantic: poll results are produced by our
+own poller from already-cast values, so schema validation would be pure
+overhead on a path that runs once per device per poll cycle.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import orjson
+
+# orjson walks dataclasses natively in C — no asdict() deep copy.
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NAIVE_UTC
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with millisecond precision.
+
+    Callers polling a batch of devices in one cycle should compute this
+    once and pass it to each PollResult rather than re-stamping per host.
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+@dataclass(slots=True)
+class InterfaceInfo:
+    """One row of ifTable, merged with ifXTable when available."""
+
+    index: int
+    name: str = ""
+    description: str = ""
+    alias: str = ""
+    if_type: int = 0
+    mtu: int = 0
+    speed_bps: int = 0
+    mac_address: str = ""
+    admin_status: int = 0
+    oper_status: int = 0
+    in_octets: int = 0
+    out_octets: int = 0
+    in_ucast_pkts: int = 0
+    out_ucast_pkts: int = 0
+    in_discards: int = 0
+    out_discards: int = 0
+    in_errors: int = 0
+    out_errors: int = 0
+    # 64-bit counters from ifXTable; None when the agent doesn't expose them
+    hc_in_octets: int | None = None
+    hc_out_octets: int | None = None
+
+
+@dataclass(slots=True)
+class StorageInfo:
+    """One row of hrStorageTable with byte totals precomputed."""
+
+    index: int
+    description: str = ""
+    allocation_units: int = 0
+    size_units: int = 0
+    used_units: int = 0
+    size_bytes: int = 0
+    used_bytes: int = 0
+    used_percent: float = 0.0
+
+
+@dataclass(slots=True)
+class CPUInfo:
+    """Per-core load from hrProcessorTable plus the mean across cores."""
+
+    load_per_core: list[int] = field(default_factory=list)
+    load_avg: float = 0.0
+
+
+@dataclass(slots=True)
+class DeviceInfo:
+    """System-group identity and uptime for a polled device."""
+
+    hostname: str = ""
+    description: str = ""
+    object_id: str = ""
+    contact: str = ""
+    location: str = ""
+    services: int = 0
+    uptime: str = ""
+    uptime_ticks: int = 0
+    # HOST-RESOURCES scalars; zero when the MIB isn't implemented
+    num_users: int = 0
+    num_processes: int = 0
+
+
+@dataclass(slots=True)
+class PollResult:
+    """Everything collected from one device in one poll cycle."""
+
+    host: str
+    timestamp: str = field(default_factory=utc_timestamp)
+    success: bool = False
+    error: str | None = None
+    device: DeviceInfo | None = None
+    interfaces: list[InterfaceInfo] = field(default_factory=list)
+    storage: list[StorageInfo] = field(default_factory=list)
+    cpu: CPUInfo | None = None
+    custom: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return orjson.loads(self.to_json_bytes())
+
+    def to_json(self) -> str:
+        # Decode the bytes form rather than encoding a second time, so
+        # callers needing both pay for one serialization pass.
+        return self.to_json_bytes().decode()
+
+    def to_json_bytes(self) -> bytes:
+        return orjson.dumps(self, option=_ORJSON_OPTS)
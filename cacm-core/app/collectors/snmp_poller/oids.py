@@ -0,0 +1,88 @@
+"""
+OID maps for the standard MIB subtrees the poller collects.
+
+Scalar maps (SYSTEM, HR_SYSTEM) hold fully-qualified instance OIDs
+(".0" suffix); table maps hold column base OIDs that get a row index
+appended by the agent.
+"""
+
+import sys
+
+# SNMPv2-MIB system group
+SYSTEM = {
+    "sysDescr": "1.3.6.1.2.1.1.1.0",
+    "sysObjectID": "1.3.6.1.2.1.1.2.0",
+    "sysUpTime": "1.3.6.1.2.1.1.3.0",
+    "sysContact": "1.3.6.1.2.1.1.4.0",
+    "sysName": "1.3.6.1.2.1.1.5.0",
+    "sysLocation": "1.3.6.1.2.1.1.6.0",
+    "sysServices": "1.3.6.1.2.1.1.7.0",
+}
+
+# HOST-RESOURCES-MIB scalars — not implemented on many OT devices
+# (relays, RTUs), so callers must tolerate their absence.
+HR_SYSTEM = {
+    "hrSystemUptime": "1.3.6.1.2.1.25.1.1.0",
+    "hrSystemDate": "1.3.6.1.2.1.25.1.2.0",
+    "hrSystemNumUsers": "1.3.6.1.2.1.25.1.5.0",
+    "hrSystemProcesses": "1.3.6.1.2.1.25.1.6.0",
+}
+
+# IF-MIB ifTable columns
+IF_TABLE = {
+    "ifIndex": "1.3.6.1.2.1.2.2.1.1",
+    "ifDescr": "1.3.6.1.2.1.2.2.1.2",
+    "ifType": "1.3.6.1.2.1.2.2.1.3",
+    "ifMtu": "1.3.6.1.2.1.2.2.1.4",
+    "ifSpeed": "1.3.6.1.2.1.2.2.1.5",
+    "ifPhysAddress": "1.3.6.1.2.1.2.2.1.6",
+    "ifAdminStatus": "1.3.6.1.2.1.2.2.1.7",
+    "ifOperStatus": "1.3.6.1.2.1.2.2.1.8",
+    "ifLastChange": "1.3.6.1.2.1.2.2.1.9",
+    "ifInOctets": "1.3.6.1.2.1.2.2.1.10",
+    "ifInUcastPkts": "1.3.6.1.2.1.2.2.1.11",
+    "ifInDiscards": "1.3.6.1.2.1.2.2.1.13",
+    "ifInErrors": "1.3.6.1.2.1.2.2.1.14",
+    "ifOutOctets": "1.3.6.1.2.1.2.2.1.16",
+    "ifOutUcastPkts": "1.3.6.1.2.1.2.2.1.17",
+    "ifOutDiscards": "1.3.6.1.2.1.2.2.1.19",
+    "ifOutErrors": "1.3.6.1.2.1.2.2.1.20",
+}
+
+# IF-MIB ifXTable columns (64-bit counters and friendly names);
+# optional on older/embedded agents.
+IF_X_TABLE = {
+    "ifName": "1.3.6.1.2.1.31.1.1.1.1",
+    "ifHCInOctets": "1.3.6.1.2.1.31.1.1.1.6",
+    "ifHCOutOctets": "1.3.6.1.2.1.31.1.1.1.10",
+    "ifHighSpeed": "1.3.6.1.2.1.31.1.1.1.15",
+    "ifAlias": "1.3.6.1.2.1.31.1.1.1.18",
+}
+
+# HOST-RESOURCES-MIB hrStorageTable columns
+HR_STORAGE = {
+    "hrStorageIndex": "1.3.6.1.2.1.25.2.3.1.1",
+    "hrStorageDescr": "1.3.6.1.2.1.25.2.3.1.3",
+    "hrStorageAllocationUnits": "1.3.6.1.2.1.25.2.3.1.4",
+    "hrStorageSize": "1.3.6.1.2.1.25.2.3.1.5",
+    "hrStorageUsed": "1.3.6.1.2.1.25.2.3.1.6",
+}
+
+# HOST-RESOURCES-MIB hrProcessorTable — one load value per core
+HR_PROCESSOR = {
+    "hrProcessorLoad": "1.3.6.1.2.1.25.3.3.1.2",
+}
+
+# Canonicalize (no trailing dot) and intern every OID once at import:
+# the poller's hot paths rely on these maps holding exactly the strings
+# pysnmp hands back, so lookups never re-strip and equality can
+# short-circuit to a pointer compare once hashed.
+for _map in (SYSTEM, HR_SYSTEM, IF_TABLE, IF_X_TABLE, HR_STORAGE, HR_PROCESSOR):
+    for _name, _oid in _map.items():
+        _map[_name] = sys.intern(_oid.rstrip("."))
+
+# Reverse maps for O(1) resolution of returned scalar OIDs to friendly
+# names, precomputed once at import instead of suffix-matching every
+# returned OID against every defined OID per poll.
+SYSTEM_BY_OID = {v: k for k, v in SYSTEM.items()}
+HR_SYSTEM_BY_OID = {v: k for k, v in HR_SYSTEM.items()}
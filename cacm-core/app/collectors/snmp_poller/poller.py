@@ -0,0 +1,838 @@
+"""
+Asynchronous SNMP poller for Cyber Asset telemetry collection.
+
+Collects system identity, interface, storage, and CPU data from IT and
+OT devices over SNMP v1/v2c/v3. OT gear (relays, RTUs, PLCs) frequently
+implements only a subset of the standard MIBs, so every table/scalar
+group degrades gracefully when absent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+import weakref
+from collections.abc import Callable, Iterable
+from typing import Any, ClassVar
+
+# v1arch skips the SNMPv3 USM machinery (key localization, security
+# models, LCD tables) entirely — cheaper engines and lighter per-PDU
+# encoding for the v1/v2c pollers that dominate OT fleets. v3arch is
+# only pulled in for SNMPv3 targets. ObjectType/ObjectIdentity are the
+# same classes in both bindings.
+from pysnmp.error import PySnmpError
+from pysnmp.hlapi.transport import AbstractTransportTarget
+from pysnmp.hlapi.v1arch import asyncio as v1arch
+from pysnmp.hlapi.v3arch import asyncio as v3arch
+from pysnmp.hlapi.v3arch.asyncio import (
+    ContextData,
+    ObjectIdentity,
+    ObjectType,
+    SnmpEngine,
+    UsmUserData,
+)
+
+from app.collectors.snmp_poller.models import (
+    CPUInfo,
+    DeviceInfo,
+    InterfaceInfo,
+    PollResult,
+    StorageInfo,
+)
+from app.collectors.snmp_poller.oids import (
+    HR_PROCESSOR,
+    HR_STORAGE,
+    HR_SYSTEM,
+    HR_SYSTEM_BY_OID,
+    IF_TABLE,
+    IF_X_TABLE,
+    SYSTEM,
+    SYSTEM_BY_OID,
+)
+
+
+class SNMPPollError(Exception):
+    """Raised when an SNMP operation fails at the protocol level."""
+
+
+# Combined reverse map for the single scalar GET in _poll_system_info.
+_SCALAR_BY_OID = {**SYSTEM_BY_OID, **HR_SYSTEM_BY_OID}
+
+# SnmpEngine construction is expensive (MIB loading, USM tables,
+# transport dispatcher); share one per event loop across all pollers in
+# the process. The v1arch SnmpDispatcher is far lighter but still worth
+# sharing for its transport dispatcher. ContextData is immutable for our
+# purposes — one constant replaces a fresh allocation per command.
+_ENGINES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SnmpEngine] = (
+    weakref.WeakKeyDictionary()
+)
+_DISPATCHERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, v1arch.SnmpDispatcher
+] = weakref.WeakKeyDictionary()
+_CONTEXT = ContextData()
+
+
+def _get_shared_engine() -> SnmpEngine:
+    loop = asyncio.get_running_loop()
+    engine = _ENGINES.get(loop)
+    if engine is None:
+        engine = _ENGINES[loop] = SnmpEngine()
+    return engine
+
+
+def _get_shared_dispatcher() -> v1arch.SnmpDispatcher:
+    loop = asyncio.get_running_loop()
+    dispatcher = _DISPATCHERS.get(loop)
+    if dispatcher is None:
+        dispatcher = _DISPATCHERS[loop] = v1arch.SnmpDispatcher()
+    return dispatcher
+
+
+# Transport targets shared per (host, port): scheduled runs that build a
+# fresh poller per cycle reuse one resolved target instead of paying
+# DNS + create() each time. Responses match requests by request-id, so
+# sharing across pollers of the same host is safe. The first poller to
+# reach a host fixes the timeout/retries baked into its target. Each
+# arch binding has its own UdpTransportTarget class, so the class joins
+# the key.
+_TRANSPORTS: dict[tuple[type, str, int], AbstractTransportTarget] = {}
+_TRANSPORT_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_transport_lock() -> asyncio.Lock:
+    # Locks are loop-bound; keep one per running loop like the engines.
+    loop = asyncio.get_running_loop()
+    lock = _TRANSPORT_LOCKS.get(loop)
+    if lock is None:
+        lock = _TRANSPORT_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+
+def _as_int(row: dict[str, Any], key: str, default: int = 0) -> int:
+    """Fetch an integer column from a pivoted row.
+
+    _cast_value already converts SNMP integer types on arrival, so the
+    common case is one dict lookup returning an int unchanged; int() only
+    runs for odd agents that report a counter as a string.
+    """
+    value = row.get(key)
+    if type(value) is int:
+        return value
+    if value is None or value == "":
+        return default
+    return int(value)
+
+
+class SNMPPoller:
+    """Polls a single device over SNMP.
+
+    Usage::
+
+        poller = SNMPPoller("10.10.50.12", community="public")
+        result = await poller.async_poll()
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        port: int = 161,
+        version: str = "v2c",
+        community: str = "public",
+        username: str | None = None,
+        auth_key: str | None = None,
+        priv_key: str | None = None,
+        timeout: float = 2.0,
+        retries: int = 1,
+        max_repetitions: int = 25,
+    ):
+        self.host = host
+        self.port = port
+        self.version = version
+        self.community = community
+        self.username = username
+        self.auth_key = auth_key
+        self.priv_key = priv_key
+        self.timeout = timeout
+        self.retries = retries
+        # Varbinds per GETBULK response; tune down for agents with small
+        # PDU buffers, up for low-latency links with big tables.
+        self._max_repetitions = max_repetitions
+        # v1/v2c ride the lightweight v1arch binding; only v3 needs the
+        # full SnmpEngine with USM.
+        self._use_v1arch = version != "v3"
+        # Max varbinds per GET PDU; larger requests are split and
+        # pipelined so agents never answer tooBig and replies stay under
+        # typical UDP fragmentation thresholds.
+        self._get_batch = 40
+        # Leaf OIDs discovered by the first walk of each table, so repeat
+        # polls of the same device can use plain GET instead of re-walking.
+        # Rows added on the device only appear after the next refresh walk
+        # (at most _cache_refresh_interval seconds later); removed rows
+        # invalidate the cache immediately via noSuchInstance.
+        self._oid_cache: dict[str, dict[str, tuple[str, int]]] = {}
+        self._cache_stamp: dict[str, float] = {}
+        self._cache_refresh_interval = 3600.0
+
+    # ── Transport / auth plumbing ────────────────────────────
+
+    def _make_auth_data(self) -> v1arch.CommunityData | UsmUserData:
+        if self.version == "v3":
+            return UsmUserData(
+                self.username or "",
+                authKey=self.auth_key,
+                privKey=self.priv_key,
+            )
+        return v1arch.CommunityData(
+            self.community, mpModel=0 if self.version == "v1" else 1
+        )
+
+    async def _get_transport(self) -> AbstractTransportTarget:
+        cls = (
+            v1arch.UdpTransportTarget if self._use_v1arch else v3arch.UdpTransportTarget
+        )
+        key = (cls, self.host, self.port)
+        transport = _TRANSPORTS.get(key)
+        if transport is None:
+            # Lock so concurrent pollers of the same host coalesce into one
+            # create() (and one DNS resolution) instead of racing.
+            async with _get_transport_lock():
+                transport = _TRANSPORTS.get(key)
+                if transport is None:
+                    transport = _TRANSPORTS[key] = await cls.create(
+                        (self.host, self.port),
+                        timeout=self.timeout,
+                        retries=self.retries,
+                    )
+        return transport
+
+    async def _cmd_get(self, *varbinds: ObjectType) -> tuple:
+        """Issue one GET through the arch binding matching self.version."""
+        transport = await self._get_transport()
+        if self._use_v1arch:
+            return await v1arch.get_cmd(
+                _get_shared_dispatcher(),
+                self._make_auth_data(),
+                transport,
+                *varbinds,
+            )
+        return await v3arch.get_cmd(
+            _get_shared_engine(),
+            self._make_auth_data(),
+            transport,
+            _CONTEXT,
+            *varbinds,
+        )
+
+    async def _cmd_bulk(
+        self, non_repeaters: int, max_repetitions: int, *varbinds: ObjectType
+    ) -> tuple:
+        """Issue one GETBULK; unlike the *_walk_cmd generators this takes
+        multiple varbinds, which the multi-column table walk relies on."""
+        transport = await self._get_transport()
+        if self._use_v1arch:
+            return await v1arch.bulk_cmd(
+                _get_shared_dispatcher(),
+                self._make_auth_data(),
+                transport,
+                non_repeaters,
+                max_repetitions,
+                *varbinds,
+            )
+        return await v3arch.bulk_cmd(
+            _get_shared_engine(),
+            self._make_auth_data(),
+            transport,
+            _CONTEXT,
+            non_repeaters,
+            max_repetitions,
+            *varbinds,
+        )
+
+    def _walker(self, transport: AbstractTransportTarget, base_oid: str) -> Any:
+        """Async generator walking one subtree (GETNEXT for v1, GETBULK
+        otherwise) through the matching arch binding."""
+        varbind = ObjectType(ObjectIdentity(base_oid))
+        if self.version == "v1":
+            return v1arch.walk_cmd(
+                _get_shared_dispatcher(),
+                self._make_auth_data(),
+                transport,
+                varbind,
+                lexicographicMode=False,
+            )
+        if self._use_v1arch:
+            return v1arch.bulk_walk_cmd(
+                _get_shared_dispatcher(),
+                self._make_auth_data(),
+                transport,
+                0,
+                self._max_repetitions,
+                varbind,
+                lexicographicMode=False,
+            )
+        return v3arch.bulk_walk_cmd(
+            _get_shared_engine(),
+            self._make_auth_data(),
+            transport,
+            _CONTEXT,
+            0,
+            self._max_repetitions,
+            varbind,
+            lexicographicMode=False,
+        )
+
+    # ── Value casting ────────────────────────────────────────
+
+    # class -> handler, filled lazily on first sight of each pysnmp type
+    # so the per-varbind hot path is a single dict hit instead of a chain
+    # of __name__ string compares.
+    _CASTERS: ClassVar[dict[type, Callable[[Any], Any]]] = {}
+
+    def _cast_value(self, value: Any) -> Any:
+        """Convert a pysnmp varbind value to a plain Python type."""
+        cls = type(value)
+        caster = self._CASTERS.get(cls)
+        if caster is None:
+            caster = self._CASTERS[cls] = self._pick_caster(cls)
+        return caster(value)
+
+    @staticmethod
+    def _pick_caster(value_cls: type) -> Callable[[Any], Any]:
+        """Name-based dispatch, run once per pysnmp type ever seen."""
+        name = value_cls.__name__
+        if name in (
+            "Integer",
+            "Integer32",
+            "Unsigned32",
+            "Counter32",
+            "Counter64",
+            "Gauge32",
+            "TimeTicks",
+        ):
+            return int
+        if name == "OctetString":
+
+            def cast_octet_string(value: Any) -> str | bytes:
+                # Valid UTF-8 is text — multi-line sysDescr (Cisco IOS
+                # embeds \r\n) must survive intact. Only undecodable
+                # payloads stay bytes; columns that are always binary
+                # (ifPhysAddress) are re-encoded at their use site.
+                raw = bytes(value)
+                try:
+                    return raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    return raw
+
+            return cast_octet_string
+        if name in ("ObjectIdentifier", "IpAddress"):
+            return lambda value: value.prettyPrint()
+        if name in ("NoSuchObject", "NoSuchInstance", "EndOfMibView"):
+            return lambda value: None
+        return str
+
+    # ── Low-level GET / WALK ─────────────────────────────────
+
+    async def _get(self, *oids: str) -> dict[str, Any]:
+        """GET a set of scalar OIDs; returns {oid: value}.
+
+        Requests larger than _get_batch varbinds are split into
+        normal-sized PDUs dispatched concurrently — transparent to
+        callers, and one oversized custom poll can't fail wholesale on an
+        agent's tooBig limit.
+        """
+        if len(oids) > self._get_batch:
+            batch = self._get_batch
+            results = await asyncio.gather(
+                *(
+                    self._get(*oids[start : start + batch])
+                    for start in range(0, len(oids), batch)
+                )
+            )
+            merged: dict[str, Any] = {}
+            for part in results:
+                merged.update(part)
+            return merged
+
+        error_indication, error_status, error_index, var_binds = await self._cmd_get(
+            *[ObjectType(ObjectIdentity(oid)) for oid in oids]
+        )
+        if error_indication:
+            raise SNMPPollError(str(error_indication))
+        if error_status:
+            raise SNMPPollError(f"{error_status.prettyPrint()} at index {error_index}")
+
+        data: dict[str, Any] = {}
+        for var_bind in var_binds:
+            # Intern at the pysnmp boundary: the same OIDs recur on every
+            # poll, so keep one str object per OID process-wide.
+            oid_str = sys.intern(str(var_bind[0]))
+            data[oid_str] = self._cast_value(var_bind[1])
+        return data
+
+    async def _walk(self, base_oid: str) -> dict[str, Any]:
+        """Walk a subtree; returns {full_oid: value} in arrival order.
+
+        v2c/v3 walks use GETBULK, which returns up to max_repetitions
+        varbinds per round-trip instead of one per GETNEXT; v1 has no
+        GETBULK and falls back to the GETNEXT walk.
+        """
+        transport = await self._get_transport()
+        walker = self._walker(transport, base_oid)
+
+        data: dict[str, Any] = {}
+        async for (
+            error_indication,
+            error_status,
+            error_index,
+            var_binds,
+        ) in walker:
+            if error_indication:
+                raise SNMPPollError(str(error_indication))
+            if error_status:
+                raise SNMPPollError(
+                    f"{error_status.prettyPrint()} at index {error_index}"
+                )
+            for var_bind in var_binds:
+                oid_str = sys.intern(str(var_bind[0]))
+                data[oid_str] = self._cast_value(var_bind[1])
+        return data
+
+    async def _walk_table(
+        self, column_oids: dict[str, str]
+    ) -> dict[int, dict[str, Any]]:
+        """Walk a table and pivot into {row_index: {col: value}}.
+
+        For v2c/v3, all column OIDs ride in a single GETBULK session, so
+        one round-trip returns max_repetitions values for every column at
+        once — one PDU stream for the whole table instead of one per
+        column. Columns end at different depths in sparse tables, so
+        completion is tracked per varbind position and the walk stops
+        once every column has left its subtree. v1 falls back to
+        concurrent per-column GETNEXT walks.
+        """
+        if self.version == "v1":
+            return await self._walk_table_per_column(column_oids)
+
+        # Interned column names make the repeated row-dict inserts below
+        # pointer-identical to previously inserted keys.
+        names = [sys.intern(name) for name in column_oids]
+        # The oids.py maps are canonicalized (stripped + interned) at
+        # import, so the values are usable as-is.
+        bases = list(column_oids.values())
+
+        # Serve repeat polls from the cached leaf OIDs via plain GET —
+        # typically 2-3x faster than re-walking the same table. An empty
+        # leaf map (table absent on the device) never takes this path:
+        # GETting zero OIDs would send an empty PDU per poll, and a
+        # re-walk of an absent table is a single cheap round-trip anyway.
+        cache_key = ";".join(bases)
+        cached = self._oid_cache.get(cache_key)
+        if (
+            cached
+            and time.monotonic() - self._cache_stamp.get(cache_key, 0.0)
+            < self._cache_refresh_interval
+        ):
+            table = await self._get_cached_table(cache_key, cached)
+            if table is not None:
+                return table
+
+        prefixes = [base + "." for base in bases]
+        # Row index starts right after "<base>." — precompute the slice
+        # start per column so the per-varbind parse below is one find()
+        # and one int() with no lstrip/split/list allocations.
+        starts = [len(base) + 1 for base in bases]
+        ncols = len(bases)
+        done = [False] * ncols
+        leaf_map: dict[str, tuple[str, int]] = {}
+
+        # Drive GETBULK ourselves: the *_walk_cmd generators only walk a
+        # single varbind, but one GETBULK PDU can carry every column, so
+        # each round-trip advances max_repetitions rows of the whole
+        # table at once.
+        table: dict[int, dict[str, Any]] = {}
+        # All columns of one repetition share a row index, so cache the
+        # current row dict: one table lookup per row instead of a
+        # setdefault (hash probe + possible empty-dict alloc) per varbind.
+        # ifIndex values aren't reliably dense on OT gear, so the table
+        # stays a dict rather than a list keyed by raw index.
+        last_idx: int | None = None
+        last_row: dict[str, Any] = {}
+        cur = list(bases)
+        while not all(done):
+            (
+                error_indication,
+                error_status,
+                error_index,
+                var_binds,
+            ) = await self._cmd_bulk(
+                0,
+                self._max_repetitions,
+                *[ObjectType(ObjectIdentity(oid)) for oid in cur],
+            )
+            if error_indication:
+                raise SNMPPollError(str(error_indication))
+            if error_status:
+                raise SNMPPollError(
+                    f"{error_status.prettyPrint()} at index {error_index}"
+                )
+            # Responses come repetition-major: ncols varbinds per row.
+            nrows = len(var_binds) // ncols
+            if not nrows:
+                break
+            for rep in range(nrows):
+                row = rep * ncols
+                for pos in range(ncols):
+                    if done[pos]:
+                        continue
+                    var_bind = var_binds[row + pos]
+                    full_oid = sys.intern(str(var_bind[0]))
+                    if var_bind[
+                        1
+                    ].__class__.__name__ == "EndOfMibView" or not full_oid.startswith(
+                        prefixes[pos]
+                    ):
+                        done[pos] = True
+                        continue
+                    start = starts[pos]
+                    end = full_oid.find(".", start)
+                    try:
+                        idx = int(
+                            full_oid[start:end] if end != -1 else full_oid[start:]
+                        )
+                    except ValueError:
+                        continue
+                    if idx != last_idx:
+                        last_row = table.get(idx)  # type: ignore[assignment]
+                        if last_row is None:
+                            last_row = table[idx] = {}
+                        last_idx = idx
+                    last_row[names[pos]] = self._cast_value(var_bind[1])
+                    leaf_map[full_oid] = (names[pos], idx)
+            # Continue each column from the last OID the agent returned.
+            last = (nrows - 1) * ncols
+            nxt = [str(var_binds[last + pos][0]) for pos in range(ncols)]
+            if nxt == cur:
+                # Non-increasing agent; bail rather than loop forever.
+                break
+            cur = nxt
+
+        self._oid_cache[cache_key] = leaf_map
+        self._cache_stamp[cache_key] = time.monotonic()
+        return table
+
+    async def _get_cached_table(
+        self, cache_key: str, leaf_map: dict[str, tuple[str, int]]
+    ) -> dict[int, dict[str, Any]] | None:
+        """Re-read a table via GET on its cached leaf OIDs.
+
+        Returns None (and drops the cache entry) when the GET fails or any
+        leaf answers noSuchInstance, signalling the caller to re-walk.
+        """
+        table: dict[int, dict[str, Any]] = {}
+        try:
+            # _get chunks and pipelines oversized requests itself.
+            data = await self._get(*leaf_map)
+            for full_oid, value in data.items():
+                entry = leaf_map.get(full_oid)
+                if entry is None:
+                    continue
+                if value is None:
+                    # noSuchInstance: the table changed under us
+                    raise SNMPPollError(f"stale cached OID {full_oid}")
+                col_name, idx = entry
+                table.setdefault(idx, {})[col_name] = value
+        except SNMPPollError:
+            self._oid_cache.pop(cache_key, None)
+            self._cache_stamp.pop(cache_key, None)
+            return None
+        return table
+
+    async def _walk_table_per_column(
+        self, column_oids: dict[str, str]
+    ) -> dict[int, dict[str, Any]]:
+        """Per-column table walk for agents without GETBULK (SNMPv1).
+
+        Columns still walk concurrently; one that errors (not implemented
+        on the agent) is skipped rather than failing the whole table.
+        """
+        results = await asyncio.gather(
+            *(self._walk(oid) for oid in column_oids.values()),
+            return_exceptions=True,
+        )
+        table: dict[int, dict[str, Any]] = {}
+        for (col_name, base_oid), walked in zip(column_oids.items(), results):
+            if isinstance(walked, BaseException):
+                continue
+            start = len(base_oid) + 1
+            for full_oid, value in walked.items():
+                end = full_oid.find(".", start)
+                try:
+                    idx = int(full_oid[start:end] if end != -1 else full_oid[start:])
+                except ValueError:
+                    continue
+                table.setdefault(idx, {})[col_name] = value
+        return table
+
+    # ── Sub-polls ────────────────────────────────────────────
+
+    async def _poll_system_info(self) -> DeviceInfo:
+        # For v2c/v3, one PDU carries both the SYSTEM and HR_SYSTEM
+        # scalars (11 varbinds, well under practical PDU limits) instead
+        # of two sequential GET round-trips: agents without
+        # HOST-RESOURCES-MIB answer those varbinds with noSuchInstance,
+        # which _cast_value maps to None. SNMPv1 has no per-varbind
+        # exception — one unimplemented OID fails the whole PDU with
+        # noSuchName — so v1 keeps the groups separate and treats a
+        # failed HR_SYSTEM GET as the MIB being absent.
+        if self.version == "v1":
+            data = await self._get(*SYSTEM.values())
+            try:
+                data.update(await self._get(*HR_SYSTEM.values()))
+            except SNMPPollError:
+                pass
+        else:
+            data = await self._get(*SYSTEM.values(), *HR_SYSTEM.values())
+
+        info: dict[str, Any] = {}
+        for oid_str, value in data.items():
+            # Returned OIDs match the canonical map keys directly — no
+            # per-OID strip on the hot path.
+            name = _SCALAR_BY_OID.get(oid_str)
+            if name is not None and value is not None:
+                info[name] = value
+
+        ticks = _as_int(info, "sysUpTime")
+        return DeviceInfo(
+            hostname=str(info.get("sysName", "") or ""),
+            description=str(info.get("sysDescr", "") or ""),
+            object_id=str(info.get("sysObjectID", "") or ""),
+            contact=str(info.get("sysContact", "") or ""),
+            location=str(info.get("sysLocation", "") or ""),
+            services=_as_int(info, "sysServices"),
+            uptime=self._format_uptime(ticks),
+            uptime_ticks=ticks,
+            num_users=_as_int(info, "hrSystemNumUsers"),
+            num_processes=_as_int(info, "hrSystemProcesses"),
+        )
+
+    async def _poll_interfaces(self) -> list[InterfaceInfo]:
+        rows = await self._walk_table(IF_TABLE)
+        # ifXTable (64-bit counters) is optional on embedded agents;
+        # _walk_table yields an empty pivot when it's absent.
+        x_rows = await self._walk_table(IF_X_TABLE)
+
+        interfaces: list[InterfaceInfo] = []
+        # Single fused pass: no rows.update(x_data) merge sweep and no
+        # intermediate (idx, dict) tuple list — each field reads straight
+        # from the table that owns it.
+        empty: dict[str, Any] = {}
+        for idx in sorted(rows.keys() | x_rows.keys()):
+            r = rows.get(idx, empty)
+            x = x_rows.get(idx, empty)
+            # ifPhysAddress is raw bytes per the MIB; bytes.hex(":")
+            # formats it in one C call. Addresses whose six bytes happen
+            # to be valid UTF-8 arrive from the caster as text and are
+            # re-encoded (decode/encode round-trips exactly); a string
+            # containing separators is an agent that pre-formatted it.
+            mac = r.get("ifPhysAddress", "") or ""
+            if isinstance(mac, (bytes, bytearray)):
+                mac = mac.hex(":")
+            elif ":" in mac or "-" in mac:
+                mac = str(mac)
+            else:
+                mac = mac.encode().hex(":")
+
+            high_speed = _as_int(x, "ifHighSpeed")
+            hc_in = x.get("ifHCInOctets")
+            hc_out = x.get("ifHCOutOctets")
+            interfaces.append(
+                InterfaceInfo(
+                    index=idx,
+                    name=str(x.get("ifName", "") or r.get("ifDescr", "") or ""),
+                    description=str(r.get("ifDescr", "") or ""),
+                    alias=str(x.get("ifAlias", "") or ""),
+                    if_type=_as_int(r, "ifType"),
+                    mtu=_as_int(r, "ifMtu"),
+                    speed_bps=(
+                        high_speed * 1_000_000 if high_speed else _as_int(r, "ifSpeed")
+                    ),
+                    mac_address=mac,
+                    admin_status=_as_int(r, "ifAdminStatus"),
+                    oper_status=_as_int(r, "ifOperStatus"),
+                    in_octets=_as_int(r, "ifInOctets"),
+                    out_octets=_as_int(r, "ifOutOctets"),
+                    in_ucast_pkts=_as_int(r, "ifInUcastPkts"),
+                    out_ucast_pkts=_as_int(r, "ifOutUcastPkts"),
+                    in_discards=_as_int(r, "ifInDiscards"),
+                    out_discards=_as_int(r, "ifOutDiscards"),
+                    in_errors=_as_int(r, "ifInErrors"),
+                    out_errors=_as_int(r, "ifOutErrors"),
+                    hc_in_octets=None if hc_in is None else int(hc_in),
+                    hc_out_octets=None if hc_out is None else int(hc_out),
+                )
+            )
+        return interfaces
+
+    async def _poll_storage(self) -> list[StorageInfo]:
+        rows = await self._walk_table(HR_STORAGE)
+        storage: list[StorageInfo] = []
+        for idx in sorted(rows):
+            r = rows[idx]
+            units = _as_int(r, "hrStorageAllocationUnits")
+            size = _as_int(r, "hrStorageSize")
+            used = _as_int(r, "hrStorageUsed")
+            storage.append(
+                StorageInfo(
+                    index=idx,
+                    description=str(r.get("hrStorageDescr", "") or ""),
+                    allocation_units=units,
+                    size_units=size,
+                    used_units=used,
+                    size_bytes=size * units,
+                    used_bytes=used * units,
+                    used_percent=round(used / size * 100, 1) if size else 0.0,
+                )
+            )
+        return storage
+
+    async def _poll_cpu(self) -> CPUInfo | None:
+        data = await self._walk(HR_PROCESSOR["hrProcessorLoad"])
+        loads = [int(v) for v in data.values() if v is not None]
+        if not loads:
+            return None
+        return CPUInfo(
+            load_per_core=loads,
+            load_avg=round(sum(loads) / len(loads), 1),
+        )
+
+    # ── Public API ───────────────────────────────────────────
+
+    async def async_poll(self) -> PollResult:
+        """Poll system, interface, storage, and CPU data from the device."""
+        result = PollResult(host=self.host)
+
+        # The four sub-polls hit disjoint OID subtrees and the UDP layer
+        # matches responses by request-id, so they run concurrently:
+        # device latency is the slowest sub-poll, not the sum of all four.
+        device, interfaces, storage, cpu = await asyncio.gather(
+            self._poll_system_info(),
+            self._poll_interfaces(),
+            self._poll_storage(),
+            self._poll_cpu(),
+            return_exceptions=True,
+        )
+        # Only SNMP-level failures are tolerated per section; anything
+        # else is a bug and propagates as before.
+        for sub in (interfaces, storage, cpu):
+            if isinstance(sub, BaseException) and not isinstance(sub, SNMPPollError):
+                raise sub
+
+        if isinstance(device, BaseException):
+            if not isinstance(device, SNMPPollError):
+                raise device
+            # If the system group is unreachable, treat the device as down
+            # even when another subtree happened to answer.
+            result.error = str(device)
+            return result
+
+        result.device = device
+        if not isinstance(interfaces, BaseException):
+            result.interfaces = interfaces
+        if not isinstance(storage, BaseException):
+            result.storage = storage
+        if not isinstance(cpu, BaseException):
+            result.cpu = cpu
+
+        result.success = True
+        return result
+
+    async def async_poll_custom(self, oid_to_name: dict[str, str]) -> dict[str, Any]:
+        """GET arbitrary scalar OIDs, returning {friendly_name: value}."""
+        # Reverse map once, then resolve each returned OID with direct
+        # lookups instead of scanning the whole request map per value.
+        canon_to_name = {
+            sys.intern(oid.lstrip(".")): name for oid, name in oid_to_name.items()
+        }
+        data = await self._get(*oid_to_name.keys())
+        out: dict[str, Any] = {}
+        for oid_str, value in data.items():
+            clean = oid_str.lstrip(".")
+            name = canon_to_name.get(clean)
+            if name is None:
+                # The agent answered with an instance suffix the caller
+                # didn't spell out; walk the returned OID's dot-prefixes,
+                # bounded by its depth rather than the map size.
+                prefix = clean
+                while name is None and "." in prefix:
+                    prefix = prefix.rsplit(".", 1)[0]
+                    name = canon_to_name.get(prefix)
+            if name is not None:
+                out[name] = value
+        return out
+
+    def poll(self) -> PollResult:
+        """Synchronous wrapper around :meth:`async_poll`."""
+        return asyncio.run(self.async_poll())
+
+    def poll_custom(self, oid_to_name: dict[str, str]) -> dict[str, Any]:
+        """Synchronous wrapper around :meth:`async_poll_custom`."""
+        return asyncio.run(self.async_poll_custom(oid_to_name))
+
+    # ── Helpers ──────────────────────────────────────────────
+
+    @staticmethod
+    def _format_uptime(ticks: int) -> str:
+        """Render TimeTicks (hundredths of a second) as '3d 4h 5m 6s'."""
+        seconds = ticks // 100
+        if not seconds:
+            return "0s"
+        days, rem = divmod(seconds, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, secs = divmod(rem, 60)
+        # One f-string, then strip the leading zero-valued units — no
+        # list build, no join, no per-unit branching.
+        return f"{days}d {hours}h {minutes}m {secs}s".lstrip("0dhm ")
+
+
+# ── Fleet polling ────────────────────────────────────────────
+
+
+async def poll_many(
+    configs: Iterable[dict[str, Any]], concurrency: int = 128
+) -> list[PollResult]:
+    """Poll a fleet of devices concurrently on one event loop.
+
+    Each config dict holds :class:`SNMPPoller` constructor arguments
+    (``{"host": ..., "community": ..., ...}``). All pollers share the
+    loop's SnmpEngine and run under a semaphore, so a 10k-device fleet
+    is one loop with ``concurrency``-way dispatch rather than one
+    ``asyncio.run`` per host. Results come back in config order;
+    per-device failures land in their PollResult's ``error`` field
+    rather than raising.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(cfg: dict[str, Any]) -> PollResult:
+        poller = SNMPPoller(**cfg)
+        async with sem:
+            try:
+                return await poller.async_poll()
+            except (SNMPPollError, PySnmpError, OSError) as exc:
+                # Transport/DNS failures surface before async_poll's own
+                # error handling (e.g. an unresolvable hostname raises in
+                # UdpTransportTarget.create); one bad device must not
+                # abort the fleet.
+                return PollResult(host=poller.host, error=str(exc))
+
+    return await asyncio.gather(*(_one(cfg) for cfg in configs))
+
+
+def poll_many_sync(
+    configs: Iterable[dict[str, Any]], concurrency: int = 128
+) -> list[PollResult]:
+    """Synchronous wrapper around :func:`poll_many` — one loop total."""
+    return asyncio.run(poll_many(configs, concurrency=concurrency))
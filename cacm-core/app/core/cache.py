@@ -0,0 +1,79 @@
+"""
+Process-wide Redis cache for read-heavy asset endpoints.
+
+The cache is best-effort: if Redis is unconfigured or unreachable, every
+helper degrades to a miss/no-op so requests still hit Postgres rather
+than failing. Keys live under the ``assets:`` prefix and are invalidated
+wholesale on any asset write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+
+_client: aioredis.Redis | None = None
+
+
+async def init_cache() -> None:
+    """Create the shared Redis connection pool (called from app lifespan)."""
+    global _client
+    _client = aioredis.from_url(str(settings.redis_dsn))
+
+
+async def close_cache() -> None:
+    """Release the connection pool on shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def cache_get(key: str) -> bytes | None:
+    if _client is None:
+        return None
+    try:
+        return await _client.get(key)
+    except (RedisError, OSError):
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl: int | None = None) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.set(key, value, ex=ttl or settings.CACHE_TTL_SECONDS)
+    except (RedisError, OSError):
+        pass
+
+
+async def cache_delete_pattern(pattern: str) -> None:
+    """Delete all keys matching a glob pattern (SCAN-based, non-blocking)."""
+    if _client is None:
+        return
+    try:
+        async for key in _client.scan_iter(match=pattern, count=100):
+            await _client.delete(key)
+    except (RedisError, OSError):
+        pass
+
+
+def invalidate_on_commit(db: AsyncSession, pattern: str) -> None:
+    """Schedule a pattern invalidation for after the transaction commits.
+
+    Deleting inside the still-open transaction leaves a window where a
+    concurrent read re-caches the pre-write snapshot, hiding the write
+    for a full TTL. The hook fires only on commit (rolled-back writes
+    never invalidate) and runs the deletion as a fire-and-forget task in
+    keeping with the cache's best-effort contract.
+    """
+
+    @event.listens_for(db.sync_session, "after_commit", once=True)
+    def _invalidate(session: object) -> None:
+        asyncio.get_running_loop().create_task(cache_delete_pattern(pattern))
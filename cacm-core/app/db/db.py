@@ -4,7 +4,16 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
 
 
-engine = create_async_engine(str(settings.pg_dsn), echo=False, future=True)
+engine = create_async_engine(
+    str(settings.pg_dsn),
+    echo=False,
+    future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
 async_session_factory = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -1,8 +1,13 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.core.cache import close_cache, init_cache
 from app.core.config import settings
 
 
@@ -10,10 +15,21 @@ def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    await init_cache()
+    yield
+    await close_cache()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
+    # orjson encodes UUID/datetime/Enum natively and is several times
+    # faster than stdlib json on large list responses.
+    default_response_class=ORJSONResponse,
 )
 
 # Set all CORS enabled origins
@@ -5,7 +5,8 @@ from datetime import datetime
 
 from pydantic import field_validator
 from sqlmodel import SQLModel, Field, Relationship, Column, DateTime
-from sqlalchemy import Enum as SAEnum, Text, func
+from sqlalchemy import Computed, Enum as SAEnum, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 
 class ImpactLevel(str, enum.Enum):
@@ -124,6 +125,20 @@ class Asset(AssetBase, table=True):
         ),
     )
 
+    # Postgres-generated tsvector over name + description, GIN-indexed
+    # for full-text search. Never written by the application.
+    search_vector: str | None = Field(
+        default=None,
+        sa_column=Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('english', coalesce(name, '') || ' ' "
+                "|| coalesce(description, ''))",
+                persisted=True,
+            ),
+        ),
+    )
+
     # Self-referential relationship
     parent_bes_cyber_system: Optional["Asset"] = Relationship(
         sa_relationship_kwargs={
@@ -217,7 +232,12 @@ class AssetUpdate(SQLModel):
 
 
 class AssetListParams(SQLModel):
-    """Query parameters for listing/filtering assets."""
+    """Query parameters for listing/filtering assets.
+
+    Documentation of the accepted parameter set; the route hands these to
+    ``AssetService.list`` as plain keyword args to avoid an extra model
+    validation pass per request.
+    """
 
     impact_level: ImpactLevel | None = None
     system_type: SystemType | None = None
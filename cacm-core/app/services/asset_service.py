@@ -1,15 +1,23 @@
 from __future__ import annotations
+
+from collections.abc import Iterable
 from uuid import UUID
 
-from sqlmodel import select, func, or_, col
+import orjson
+from sqlalchemy import insert, lambda_stmt, text, update
+from sqlmodel import select, func, col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.cache import cache_get, cache_set, invalidate_on_commit
+
 from app.models.asset import (
     Asset,
     AssetCreate,
     AssetUpdate,
-    AssetListParams,
     AssetStatus,
+    AssetSummary,
+    DeviceClass,
+    ImpactLevel,
     SystemType,
 )
 
@@ -30,101 +38,311 @@ class AssetService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def create(self, data: AssetCreate) -> Asset:
-        if (
-            data.system_type == SystemType.BES_CYBER_SYSTEM
-            and data.parent_bes_cyber_system_id is not None
-        ):
-            raise AssetValidationError(
-                "BES Cyber System assets cannot have a parent BES Cyber System"
-            )
+    async def _validate_parent_links(self, items: Iterable[AssetCreate]) -> None:
+        """Enforce the parent-link rule for one or more assets to create.
+
+        BES Cyber System assets must not declare a parent; any other system
+        type that declares one must reference an existing BES Cyber System.
+        Both create paths share this single implementation so the rule
+        cannot drift between them.
+        """
+        parent_ids: set[UUID] = set()
+        for item in items:
+            if item.system_type == SystemType.BES_CYBER_SYSTEM:
+                if item.parent_bes_cyber_system_id is not None:
+                    raise AssetValidationError(
+                        "BES Cyber System assets cannot have a parent BES Cyber System"
+                    )
+            elif item.parent_bes_cyber_system_id is not None:
+                parent_ids.add(item.parent_bes_cyber_system_id)
 
-        # If an associated system type, validate the parent exists and is a BCS
-        if (
-            data.system_type != SystemType.BES_CYBER_SYSTEM
-            and data.parent_bes_cyber_system_id is not None
-        ):
-            parent = await self.db.get(Asset, data.parent_bes_cyber_system_id)
-            if parent is None:
+        if not parent_ids:
+            return
+
+        # One query validates every referenced parent; only the parents'
+        # system_type matters, so no full rows enter the session.
+        rows = await self.db.execute(
+            select(Asset.id, Asset.system_type).where(col(Asset.id).in_(parent_ids))
+        )
+        types_by_id = dict(rows.all())
+        for parent_id in parent_ids:
+            parent_type = types_by_id.get(parent_id)
+            if parent_type is None:
                 raise AssetValidationError(
-                    f"Parent BES Cyber System {data.parent_bes_cyber_system_id} not found"
+                    f"Parent BES Cyber System {parent_id} not found"
                 )
-            if parent.system_type != SystemType.BES_CYBER_SYSTEM:
+            if parent_type != SystemType.BES_CYBER_SYSTEM:
                 raise AssetValidationError(
-                    f"Parent asset {parent.id} is not a BES Cyber System"
+                    f"Parent asset {parent_id} is not a BES Cyber System"
                 )
 
+    async def create(self, data: AssetCreate) -> Asset:
+        await self._validate_parent_links((data,))
+
         asset = Asset.model_validate(data)
-        self.db.add(asset)
-        await self.db.flush()
-        await self.db.refresh(asset)
+        # Single INSERT ... RETURNING round-trip; the server-defaulted
+        # created_at/updated_at come back without a follow-up SELECT.
+        stmt = (
+            insert(Asset)
+            .values(
+                **asset.model_dump(
+                    exclude={"created_at", "updated_at", "search_vector"}
+                )
+            )
+            .returning(Asset)
+        )
+        result = await self.db.execute(stmt)
+        asset = result.scalar_one()
+        invalidate_on_commit(self.db, "assets:*")
         return asset
 
+    async def create_many(self, data: list[AssetCreate]) -> list[Asset]:
+        """Register a batch of assets with a single multi-row INSERT.
+
+        UUIDs are generated client-side, so the whole batch is one
+        INSERT ... RETURNING statement with no per-row ORM flush cycle.
+        """
+        if not data:
+            return []
+
+        await self._validate_parent_links(data)
+
+        assets = [Asset.model_validate(item) for item in data]
+        stmt = (
+            insert(Asset)
+            .values(
+                [
+                    asset.model_dump(
+                        exclude={"created_at", "updated_at", "search_vector"}
+                    )
+                    for asset in assets
+                ]
+            )
+            .returning(Asset)
+        )
+        result = await self.db.execute(stmt)
+        created = list(result.scalars().all())
+        invalidate_on_commit(self.db, "assets:*")
+        return created
+
     async def get(self, asset_id: UUID) -> Asset:
-        asset = await self.db.get(Asset, asset_id)
+        # lambda_stmt caches the compiled SELECT for this call site; only
+        # the bound id changes between invocations.
+        stmt = lambda_stmt(lambda: select(Asset).where(col(Asset.id) == asset_id))
+        asset = (await self.db.execute(stmt)).scalar_one_or_none()
         if asset is None:
             raise AssetNotFoundError(asset_id)
         return asset
 
-    async def list(self, params: AssetListParams) -> tuple[list[Asset], int]:
-        query = select(Asset)
-        count_query = select(func.count()).select_from(Asset)
-
-        # Apply filters
-        conditions = []
-        if params.impact_level is not None:
-            conditions.append(col(Asset.impact_level) == params.impact_level)
-        if params.system_type is not None:
-            conditions.append(col(Asset.system_type) == params.system_type)
-        if params.device_class is not None:
-            conditions.append(col(Asset.device_class) == params.device_class)
-        if params.site is not None:
-            conditions.append(col(Asset.site).ilike(f"%{params.site}%"))
-        if params.status is not None:
-            conditions.append(col(Asset.status) == params.status)
-        if params.parent_bes_cyber_system_id is not None:
-            conditions.append(
-                col(Asset.parent_bes_cyber_system_id)
-                == params.parent_bes_cyber_system_id
-            )
-        if params.search:
-            search_term = f"%{params.search}%"
-            conditions.append(
-                or_(
-                    col(Asset.name).ilike(search_term),
-                    col(Asset.description).ilike(search_term),
+    async def list(
+        self,
+        *,
+        impact_level: ImpactLevel | None = None,
+        system_type: SystemType | None = None,
+        device_class: DeviceClass | None = None,
+        site: str | None = None,
+        status: AssetStatus | None = None,
+        parent_bes_cyber_system_id: UUID | None = None,
+        search: str | None = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> tuple[list[AssetSummary], int]:
+        # Dashboards re-request the same filter combinations far more often
+        # than assets change; serve repeats from Redis until a write
+        # invalidates the namespace. The param tuple is serialized rather
+        # than colon-joined so user-controlled site/search values can't
+        # collide with the delimiter.
+        cache_key = (
+            "assets:list:"
+            + orjson.dumps(
+                (
+                    impact_level,
+                    system_type,
+                    device_class,
+                    site,
+                    status,
+                    parent_bes_cyber_system_id,
+                    search,
+                    offset,
+                    limit,
                 )
+            ).decode()
+        )
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            # model_validate re-coerces the JSON strings back into UUID/
+            # enum fields — still far cheaper than the DB round-trip, and
+            # keeps the typed contract intact for response serialization.
+            payload = orjson.loads(cached)
+            return (
+                [AssetSummary.model_validate(item) for item in payload["items"]],
+                payload["total"],
+            )
+
+        # Filters arrive pre-validated from the FastAPI query layer, so
+        # they're taken as plain keyword args rather than re-wrapped in a
+        # model just to be unpacked again (see AssetListParams for the
+        # documented parameter set).
+        #
+        # lambda_stmt caches statement construction and compilation per
+        # call site, so each filter combination compiles its SQL once per
+        # process and later calls only swap bound parameters.
+        #
+        # Single round-trip: COUNT(*) OVER () yields the pre-LIMIT total
+        # on every row, replacing a separate count query. Project only
+        # the AssetSummary columns so wide fields (description Text, ip,
+        # mac, timestamps) never leave the database.
+        # For the unfiltered "show all" page the windowed count would still
+        # scan the whole table; use the planner's row estimate instead and
+        # skip the count column entirely. Unfiltered totals are therefore
+        # approximate (exact counting is used until first ANALYZE).
+        filtered = any(
+            v is not None
+            for v in (
+                impact_level,
+                system_type,
+                device_class,
+                site,
+                status,
+                parent_bes_cyber_system_id,
             )
+        ) or bool(search)
 
-        if conditions:
-            query = query.where(*conditions)
-            count_query = count_query.where(*conditions)
+        if filtered:
+            stmt = lambda_stmt(
+                lambda: select(
+                    Asset.id,
+                    Asset.name,
+                    Asset.impact_level,
+                    Asset.system_type,
+                    Asset.device_class,
+                    Asset.site,
+                    Asset.status,
+                    func.count().over().label("total"),
+                )
+            )
+        else:
+            stmt = lambda_stmt(
+                lambda: select(
+                    Asset.id,
+                    Asset.name,
+                    Asset.impact_level,
+                    Asset.system_type,
+                    Asset.device_class,
+                    Asset.site,
+                    Asset.status,
+                )
+            )
+        if impact_level is not None:
+            stmt += lambda s: s.where(col(Asset.impact_level) == impact_level)
+        if system_type is not None:
+            stmt += lambda s: s.where(col(Asset.system_type) == system_type)
+        if device_class is not None:
+            stmt += lambda s: s.where(col(Asset.device_class) == device_class)
+        if site is not None:
+            site_pattern = f"%{site}%"
+            stmt += lambda s: s.where(col(Asset.site).ilike(site_pattern))
+        if status is not None:
+            stmt += lambda s: s.where(col(Asset.status) == status)
+        if parent_bes_cyber_system_id is not None:
+            stmt += lambda s: s.where(
+                col(Asset.parent_bes_cyber_system_id) == parent_bes_cyber_system_id
+            )
+        if search:
+            # Full-text search against the GIN-indexed generated tsvector
+            # instead of an unindexable dual ILIKE scan.
+            stmt += lambda s: s.where(
+                col(Asset.search_vector).op("@@")(
+                    func.plainto_tsquery("english", search)
+                )
+            )
+        stmt += lambda s: s.order_by(col(Asset.name)).offset(offset).limit(limit)
+        rows = (await self.db.execute(stmt)).all()
 
-        # Total count
-        total_result = await self.db.exec(count_query)
-        total = total_result.one()
+        # model_construct skips re-validation; the rows come straight from
+        # typed enum columns, so coercion would be pure overhead.
+        assets = [
+            AssetSummary.model_construct(
+                id=row.id,
+                name=row.name,
+                impact_level=row.impact_level,
+                system_type=row.system_type,
+                device_class=row.device_class,
+                site=row.site,
+                status=row.status,
+            )
+            for row in rows
+        ]
+        if filtered:
+            if rows:
+                total = rows[0].total
+            elif offset:
+                # Page past the last match: no row carries the windowed
+                # count, but matches may still exist — fall back to an
+                # explicit count with the same filters so pager UIs keep
+                # a correct total.
+                count_stmt = select(func.count()).select_from(Asset)
+                if impact_level is not None:
+                    count_stmt = count_stmt.where(
+                        col(Asset.impact_level) == impact_level
+                    )
+                if system_type is not None:
+                    count_stmt = count_stmt.where(col(Asset.system_type) == system_type)
+                if device_class is not None:
+                    count_stmt = count_stmt.where(
+                        col(Asset.device_class) == device_class
+                    )
+                if site is not None:
+                    count_stmt = count_stmt.where(col(Asset.site).ilike(f"%{site}%"))
+                if status is not None:
+                    count_stmt = count_stmt.where(col(Asset.status) == status)
+                if parent_bes_cyber_system_id is not None:
+                    count_stmt = count_stmt.where(
+                        col(Asset.parent_bes_cyber_system_id)
+                        == parent_bes_cyber_system_id
+                    )
+                if search:
+                    count_stmt = count_stmt.where(
+                        col(Asset.search_vector).op("@@")(
+                            func.plainto_tsquery("english", search)
+                        )
+                    )
+                total = int(await self.db.scalar(count_stmt) or 0)
+            else:
+                total = 0
+        else:
+            total = await self.db.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'assets'")
+            )
+            if total is None or total < 0:
+                # reltuples is -1 until the table is first analyzed
+                total = await self.db.scalar(select(func.count()).select_from(Asset))
+            total = int(total or 0)
 
-        # Paginated results
-        query = (
-            query.order_by(col(Asset.name)).offset(params.offset).limit(params.limit)
+        await cache_set(
+            cache_key,
+            orjson.dumps({"items": [a.model_dump() for a in assets], "total": total}),
         )
-        result = await self.db.exec(query)
-        assets = list(result.all())
-
         return assets, total
 
     async def update(self, asset_id: UUID, data: AssetUpdate) -> Asset:
-        asset = await self.get(asset_id)
-
         update_data = data.model_dump(exclude_unset=True)
         if not update_data:
-            return asset
+            return await self.get(asset_id)
 
-        asset.sqlmodel_update(update_data)
-
-        self.db.add(asset)
-        await self.db.flush()
-        await self.db.refresh(asset)
+        # UPDATE ... RETURNING resolves existence and applies the change
+        # in one statement; an empty result means the asset doesn't exist.
+        stmt = (
+            update(Asset)
+            .where(col(Asset.id) == asset_id)
+            .values(**update_data)
+            .returning(Asset)
+        )
+        result = await self.db.execute(stmt)
+        asset = result.scalar_one_or_none()
+        if asset is None:
+            raise AssetNotFoundError(asset_id)
+        invalidate_on_commit(self.db, "assets:*")
         return asset
 
     async def decommission(self, asset_id: UUID) -> Asset:
@@ -133,25 +351,60 @@ class AssetService:
         CIP-010-4 requires evidence retention for 3 calendar years,
         so we never hard-delete asset records.
         """
-        asset = await self.get(asset_id)
-        asset.status = AssetStatus.DECOMMISSIONED
-        self.db.add(asset)
-        await self.db.flush()
-        await self.db.refresh(asset)
+        stmt = (
+            update(Asset)
+            .where(col(Asset.id) == asset_id)
+            .values(status=AssetStatus.DECOMMISSIONED)
+            .returning(Asset)
+        )
+        result = await self.db.execute(stmt)
+        asset = result.scalar_one_or_none()
+        if asset is None:
+            raise AssetNotFoundError(asset_id)
+        invalidate_on_commit(self.db, "assets:*")
         return asset
 
     async def get_associated_assets(self, bes_cyber_system_id: UUID) -> list[Asset]:
         """Get all EACMS, PACS, and PCA associated with a BES Cyber System."""
-        parent = await self.get(bes_cyber_system_id)
-        if parent.system_type != SystemType.BES_CYBER_SYSTEM:
-            raise AssetValidationError(
-                f"Asset {bes_cyber_system_id} is not a BES Cyber System"
-            )
+        cache_key = f"assets:assoc:{bes_cyber_system_id}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return [Asset.model_validate(item) for item in orjson.loads(cached)]
 
+        # Fold the parent-type validation into the children query via a
+        # single-row CTE, so the common case is one round-trip instead of
+        # a lookup followed by the actual SELECT.
+        parent_cte = (
+            select(col(Asset.system_type).label("parent_system_type"))
+            .where(col(Asset.id) == bes_cyber_system_id)
+            .cte("parent")
+        )
         query = (
-            select(Asset)
+            select(Asset, parent_cte.c.parent_system_type)
             .where(col(Asset.parent_bes_cyber_system_id) == bes_cyber_system_id)
             .order_by(col(Asset.system_type), col(Asset.name))
         )
-        result = await self.db.exec(query)
-        return list(result.all())
+        rows = (await self.db.execute(query)).all()
+
+        if rows:
+            if rows[0][1] != SystemType.BES_CYBER_SYSTEM:
+                raise AssetValidationError(
+                    f"Asset {bes_cyber_system_id} is not a BES Cyber System"
+                )
+            assets = [row[0] for row in rows]
+            await cache_set(cache_key, orjson.dumps([a.model_dump() for a in assets]))
+            return assets
+
+        # No children: probe the parent separately to distinguish a missing
+        # asset from a childless BES Cyber System.
+        parent_type = await self.db.scalar(
+            select(Asset.system_type).where(col(Asset.id) == bes_cyber_system_id)
+        )
+        if parent_type is None:
+            raise AssetNotFoundError(bes_cyber_system_id)
+        if parent_type != SystemType.BES_CYBER_SYSTEM:
+            raise AssetValidationError(
+                f"Asset {bes_cyber_system_id} is not a BES Cyber System"
+            )
+        await cache_set(cache_key, orjson.dumps([]))
+        return []